@@ -5,13 +5,56 @@ Organizes files based on their extensions into categorized folders
 """
 
 import os
+import atexit
+import errno
 import json
 import shutil
 import logging
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import sys
+from functools import lru_cache
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import win32file  # type: ignore
+except ImportError:
+    win32file = None
+
+# Cross-device copies at least this large skip the Windows file cache
+LARGE_FILE_BYTES = 1024 * 1024
+COPY_FILE_NO_BUFFERING = 0x00001000
+
+
+@lru_cache(maxsize=8)
+def _read_config(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a config file, memoized by its path, mtime and size"""
+    return _json_loads(Path(path).read_bytes())
+
+
+# Background writer for log records, started by the first organizer
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener():
+    """Flush queued log records and stop the background writer"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 class FileOrganizer:
@@ -20,13 +63,18 @@ class FileOrganizer:
         self.config_path = config_path
         self.config = self._load_config()
         self._setup_logging()
+        self._compile_rules()
         self.stats = {"moved": 0, "skipped": 0, "errors": 0}
+        self.moved_by_category: Counter = Counter()
+        self._lock = threading.Lock()
 
     def _load_config(self) -> Dict:
         """Load configuration from JSON file"""
         try:
-            with open(self.config_path, "r") as f:
-                return json.load(f)
+            st = os.stat(self.config_path)
+            config = _read_config(self.config_path, st.st_mtime_ns, st.st_size)
+            # Shallow copy so callers can override top-level keys like dry_run
+            return dict(config)
         except FileNotFoundError:
             print(f"Error: Config file '{self.config_path}' not found!")
             sys.exit(1)
@@ -49,70 +97,162 @@ class FileOrganizer:
 
         log_file = log_dir / f"organizer_{datetime.now().strftime('%Y%m%d')}.log"
 
-        logging.basicConfig(
-            level=log_level,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
-        )
+        # Like basicConfig, leave an already configured root logger alone
+        root = logging.getLogger()
+        if not root.handlers:
+            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+            handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+
+            # Workers only enqueue records, a background thread does the I/O
+            global _log_listener
+            log_queue = queue.SimpleQueue()
+            _log_listener = QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            _log_listener.start()
+            atexit.register(_stop_log_listener)
+
+            root.setLevel(log_level)
+            root.addHandler(QueueHandler(log_queue))
+
         self.logger = logging.getLogger(__name__)
 
+    def _compile_rules(self):
+        """Precompute settings and lookups used on every file"""
+        # Settings read on every file
+        self._organize_by_date = bool(self.config.get("organize_by_date", False))
+        self._date_format = self.config.get("date_format", "%Y-%m")
+        self._dry_run = bool(self.config.get("dry_run", False))
+        self._dup_mode = self.config.get("duplicate_handling", "rename")
+
+        # Date folder names per 15 minute bucket, which never straddles a
+        # local midnight. Formats that include a time of day are not cached.
+        time_directives = ("%H", "%I", "%M", "%S", "%p", "%f", "%X", "%c", "%T", "%R")
+        self._cache_dates = not any(d in self._date_format for d in time_directives)
+        self._date_bucket_cache: Dict[int, str] = {}
+
+        # Extension -> category, the first rule listing an extension wins
+        self._ext_to_category: Dict[str, str] = {}
+        for category, rules in self.config.get("organize_rules", {}).items():
+            for ext in rules.get("extensions", []):
+                self._ext_to_category.setdefault(ext.lower(), category)
+
+        self._ignore_exts = frozenset(
+            ext.lower() for ext in self.config.get("ignore_extensions", [])
+        )
+        self._ignore_files = frozenset(self.config.get("ignore_files", []))
+        # str.endswith takes a tuple, so ignored names are rejected in one
+        # call; "" and undotted entries only ever match the exact extension
+        self._ignore_suffixes = tuple(
+            ext for ext in self._ignore_exts if ext.startswith(".") and ext != "."
+        )
+
+        self._category_targets: Dict[str, Path] = {
+            category: Path(rules["target_folder"])
+            for category, rules in self.config.get("organize_rules", {}).items()
+        }
+
+        # Extras lives next to the first configured target folder
+        if self._category_targets:
+            base_path = next(iter(self._category_targets.values())).parent
+            self._extras_target = base_path / "Extras"
+        else:
+            self._extras_target = Path("C:\\Users\\lnloh\\Documents\\Organized\\Extras")
+
+        # Target roots are never traversed, files moved there would be revisited
+        self._skip_dirs = frozenset(
+            os.path.normcase(os.path.realpath(folder))
+            for folder in [*self._category_targets.values(), self._extras_target]
+        )
+
+        # Folders already created during this run
+        self._mkdir_cache: Set[Path] = set()
+
+        # Device id per target folder, to detect same-filesystem moves
+        self._dev_cache: Dict[Path, int] = {}
+
+        # Names known to exist per target folder, filled on first collision
+        self._dir_contents_cache: Dict[Path, Set[str]] = {}
+
+        # Targets claimed by in-flight moves but not yet on disk
+        self._reserved_targets: Set[Path] = set()
+
     def _get_file_category(self, file_path: Path) -> Optional[str]:
         """Determine the category of a file based on its extension"""
-        extension = file_path.suffix.lower()
+        return self._category_for_name(file_path.name)
 
-        # Check if extension should be ignored
-        if extension in self.config.get("ignore_extensions", []):
-            return None
+    def _category_for_name(self, name: str) -> Optional[str]:
+        """Determine the category of a bare file name"""
+        lowered = name.lower()
 
-        # Check if filename should be ignored
-        if file_path.name in self.config.get("ignore_files", []):
+        # Check if extension or filename should be ignored. Matching starts
+        # at index 1 so a dotfile like ".tmp" (which has no suffix) is kept
+        if lowered.endswith(self._ignore_suffixes, 1) or name in self._ignore_files:
             return None
 
-        # Find matching category
-        for category, rules in self.config.get("organize_rules", {}).items():
-            if extension in rules.get("extensions", []):
-                return category
+        # Same rule as Path.suffix, without building a Path per file
+        dot = name.rfind(".")
+        extension = lowered[dot:] if 0 < dot < len(name) - 1 else ""
+        if extension in self._ignore_exts:
+            return None
 
         # Return 'Extras' for files without a matching category
-        return "Extras"
-
-    def _get_target_path(self, file_path: Path, category: str) -> Path:
+        return self._ext_to_category.get(extension, "Extras")
+
+    def _date_subfolder(self, mtime: float) -> str:
+        """Format a modification time as a date folder name"""
+        if not self._cache_dates:
+            return datetime.fromtimestamp(mtime).strftime(self._date_format)
+
+        bucket = int(mtime) // 900
+        folder = self._date_bucket_cache.get(bucket)
+        if folder is None:
+            folder = datetime.fromtimestamp(mtime).strftime(self._date_format)
+            self._date_bucket_cache[bucket] = folder
+        return folder
+
+    def _get_target_path(
+        self, file_path: Path, category: str, entry: Optional[os.DirEntry] = None
+    ) -> Path:
         """Get the target path for a file"""
-        # Handle Extras category with a default location
         if category == "Extras":
-            # Get base path from any organize rule or use default
-            base_paths = [
-                Path(rules["target_folder"]).parent
-                for rules in self.config.get("organize_rules", {}).values()
-            ]
-            if base_paths:
-                target_folder = base_paths[0] / "Extras"
-            else:
-                target_folder = Path("C:\\Users\\lnloh\\Documents\\Organized\\Extras")
+            target_folder = self._extras_target
         else:
-            target_folder = Path(
-                self.config["organize_rules"][category]["target_folder"]
-            )
+            target_folder = self._category_targets[category]
 
         # Create subfolder by date if enabled
-        if self.config.get("organize_by_date", False):
-            date_format = self.config.get("date_format", "%Y-%m")
-            file_date = datetime.fromtimestamp(file_path.stat().st_mtime)
-            target_folder = target_folder / file_date.strftime(date_format)
-
-        target_folder.mkdir(parents=True, exist_ok=True)
+        if self._organize_by_date:
+            # Reuse the stat cached on the scandir entry when available
+            file_stat = entry.stat() if entry is not None else file_path.stat()
+            target_folder = target_folder / self._date_subfolder(file_stat.st_mtime)
+
+        if target_folder not in self._mkdir_cache:
+            target_folder.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(target_folder)
         return target_folder / file_path.name
 
+    def _record(self, outcomes: Counter):
+        """Merge (stats key, category) outcome counts into the stats"""
+        with self._lock:
+            for (key, category), count in outcomes.items():
+                self.stats[key] += count
+                if category is not None:
+                    self.moved_by_category[category] += count
+
+    def _target_taken(self, target_path: Path) -> bool:
+        """Check whether a target exists or is claimed by another worker"""
+        return target_path in self._reserved_targets or os.path.exists(target_path)
+
     def _handle_duplicate(self, target_path: Path) -> Optional[Path]:
         """Handle duplicate file names"""
-        if not target_path.exists():
+        if not self._target_taken(target_path):
             return target_path
 
-        duplicate_handling = self.config.get("duplicate_handling", "rename")
-
-        if duplicate_handling == "skip":
+        if self._dup_mode == "skip":
             return None
-        elif duplicate_handling == "overwrite":
+        elif self._dup_mode == "overwrite":
             return target_path
         else:  # rename
             counter = 1
@@ -120,58 +260,192 @@ class FileOrganizer:
             suffix = target_path.suffix
             parent = target_path.parent
 
-            while target_path.exists():
+            # List the folder once and pick free names from memory
+            taken = self._dir_contents_cache.get(parent)
+            if taken is None:
+                taken = set(os.listdir(parent))
+                self._dir_contents_cache[parent] = taken
+
+            while True:
                 new_name = f"{stem}_{counter}{suffix}"
-                target_path = parent / new_name
                 counter += 1
+                if new_name in taken:
+                    continue
+                taken.add(new_name)
+                target_path = parent / new_name
+                # Guard against files added since the listing was cached
+                if not self._target_taken(target_path):
+                    return target_path
+
+    def _recreate_folder(self, folder: Path):
+        """Drop cached state for a vanished target folder and make it again"""
+        self._dev_cache.pop(folder, None)
+        self._dir_contents_cache.pop(folder, None)
+        folder.mkdir(parents=True, exist_ok=True)
+        self._mkdir_cache.add(folder)
+
+    def _move_file(
+        self, file_path: Path, target_path: Path, entry: Optional[os.DirEntry] = None
+    ):
+        """Move a file, using a single rename when both sides share a device"""
+        src_stat = entry.stat() if entry is not None else file_path.stat()
+
+        target_folder = target_path.parent
+        target_dev = self._dev_cache.get(target_folder)
+        if target_dev is None:
+            target_dev = os.stat(target_folder).st_dev
+            self._dev_cache[target_folder] = target_dev
+
+        # DirEntry.stat() leaves st_dev at 0 on Windows, so just try renaming
+        if src_stat.st_dev in (target_dev, 0):
+            try:
+                os.replace(file_path, target_path)
+                return
+            except OSError as e:
+                # Bind mounts share a device id but still refuse rename()
+                if e.errno != errno.EXDEV:
+                    raise
+
+        # Large cross-volume moves on Windows: unbuffered kernel copy
+        if win32file is not None and src_stat.st_size >= LARGE_FILE_BYTES:
+            win32file.CopyFileEx(
+                str(file_path),
+                str(target_path),
+                None,
+                None,
+                False,
+                COPY_FILE_NO_BUFFERING,
+            )
+            os.unlink(file_path)
+            return
 
-            return target_path
+        shutil.move(file_path, target_path)
 
-    def organize_file(self, file_path: Path) -> bool:
+    def organize_file(
+        self, file_path: Path, entry: Optional[os.DirEntry] = None
+    ) -> bool:
         """Organize a single file"""
-        try:
-            # Skip if it's a directory
+        # Skip if it's a directory (scandir entries are already known files)
+        if entry is None and file_path.is_dir():
+            return False
+
+        outcome = self._organize(file_path, entry)
+        self._record(Counter([outcome]))
+        return outcome[0] == "moved"
+
+    def organize_files(self, file_paths: Iterable[Path]) -> int:
+        """Organize a batch of files and return how many were moved"""
+        outcomes: Counter = Counter()
+        batch = []
+        for file_path in file_paths:
             if file_path.is_dir():
-                return False
+                continue
+            category = self._category_for_name(file_path.name)
+            if category is None:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Skipping ignored file: {file_path.name}")
+                outcomes[("skipped", None)] += 1
+                continue
+            batch.append((category, file_path))
+
+        # Consecutive moves into the same folder reuse its cached metadata
+        batch.sort(key=lambda item: item[0])
+        for category, file_path in batch:
+            outcomes[self._organize(file_path, None, category)] += 1
+
+        self._record(outcomes)
+        return sum(
+            count for (key, _category), count in outcomes.items() if key == "moved"
+        )
 
-            # Get category
-            category = self._get_file_category(file_path)
+    def _organize(
+        self,
+        file_path: Path,
+        entry: Optional[os.DirEntry] = None,
+        category: Optional[str] = None,
+    ) -> Tuple[str, Optional[str]]:
+        """Organize a file and return its (stats key, category) outcome"""
+        try:
+            # Get category unless the caller already classified the name
+            if category is None:
+                category = self._get_file_category(file_path)
             if not category:
                 # Files with ignored extensions/names
                 self.logger.debug(f"Skipping ignored file: {file_path.name}")
-                self.stats["skipped"] += 1
-                return False
+                return ("skipped", None)
 
             # Get target path
-            target_path = self._get_target_path(file_path, category)
+            target_path = self._get_target_path(file_path, category, entry)
 
-            # Handle duplicates
-            target_path = self._handle_duplicate(target_path)
+            # Handle duplicates, reserving the name until the move lands
+            with self._lock:
+                target_path = self._handle_duplicate(target_path)
+                if target_path:
+                    self._reserved_targets.add(target_path)
             if not target_path:
                 self.logger.info(f"Skipping duplicate: {file_path.name}")
-                self.stats["skipped"] += 1
-                return False
+                return ("skipped", None)
 
             # Move file (or simulate in dry-run mode)
-            if self.config.get("dry_run", False):
-                self.logger.info(f"[DRY RUN] Would move: {file_path} -> {target_path}")
-            else:
-                shutil.move(str(file_path), str(target_path))
-                self.logger.info(
-                    f"Moved: {file_path.name} -> {category}/{target_path.name}"
-                )
-
-            self.stats["moved"] += 1
-            return True
+            try:
+                if self._dry_run:
+                    self.logger.info(
+                        f"[DRY RUN] Would move: {file_path} -> {target_path}"
+                    )
+                else:
+                    try:
+                        self._move_file(file_path, target_path, entry)
+                    except FileNotFoundError:
+                        # Target folder deleted since it was cached: recreate
+                        # it and retry once (a missing source still raises)
+                        if target_path.parent.is_dir():
+                            raise
+                        self._recreate_folder(target_path.parent)
+                        self._move_file(file_path, target_path, entry)
+                    # Per-file success lines are debug only, run() logs totals
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            f"Moved: {file_path.name} -> {category}/{target_path.name}"
+                        )
+            finally:
+                with self._lock:
+                    self._reserved_targets.discard(target_path)
+
+            return ("moved", category)
 
         except PermissionError:
             self.logger.error(f"Permission denied: {file_path}")
-            self.stats["errors"] += 1
         except Exception as e:
             self.logger.error(f"Error organizing {file_path}: {str(e)}")
-            self.stats["errors"] += 1
-
-        return False
+            # A target folder may have been removed since it was cached
+            self._mkdir_cache.clear()
+
+        return ("errors", None)
+
+    def _iter_files(self, dir_path: Path, recursive: bool) -> Iterator[os.DirEntry]:
+        """Lazily yield file entries using os.scandir"""
+        # Symlinked folders are not followed, so paths under a resolved root
+        # stay resolved and can be checked against _skip_dirs as-is
+        stack = [os.path.realpath(dir_path)]
+        # Locals for the per-entry loop
+        skip_dirs = self._skip_dirs
+        normcase = os.path.normcase
+
+        while stack:
+            current = stack.pop()
+            try:
+                it = os.scandir(current)
+            except OSError as e:
+                self.logger.warning(f"Cannot read directory {current}: {e}")
+                continue
+
+            with it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        if normcase(entry.path) not in skip_dirs:
+                            stack.append(entry.path)
 
     def organize_directory(self, directory: str):
         """Organize all files in a directory"""
@@ -187,19 +461,36 @@ class FileOrganizer:
 
         self.logger.info(f"Organizing directory: {directory}")
 
-        # Get files based on recursive setting
+        # Walk files lazily based on recursive setting
         recursive = self.config.get("recursive", False)
-        if recursive:
-            # Get all files recursively
-            files = [f for f in dir_path.rglob("*") if f.is_file()]
-        else:
-            # Get all files (not recursive)
-            files = [f for f in dir_path.iterdir() if f.is_file()]
+        entries = self._iter_files(dir_path, recursive)
 
-        self.logger.info(f"Found {len(files)} files to process")
-
-        for file_path in files:
-            self.organize_file(file_path)
+        # Overlap moves across threads; dry runs are cheap enough to stay serial
+        max_workers = self.config.get("max_workers", min(32, (os.cpu_count() or 1) * 4))
+        if max_workers <= 1 or self._dry_run:
+            outcomes = Counter(map(self._organize_entry, entries))
+        else:
+            # executor.map submits everything up front, so feed it bounded
+            # slices to keep the directory walk lazy
+            outcomes = Counter()
+            chunk_size = max_workers * 4
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while chunk := list(islice(entries, chunk_size)):
+                    outcomes.update(executor.map(self._organize_entry, chunk))
+
+        # Workers only return outcomes, stats are merged once per directory
+        self._record(outcomes)
+        self.logger.info(f"Processed {sum(outcomes.values())} files")
+
+    def _organize_entry(self, entry: os.DirEntry) -> Tuple[str, Optional[str]]:
+        """Organize a file yielded by _iter_files"""
+        # Reject ignored names before building a Path for them
+        category = self._category_for_name(entry.name)
+        if category is None:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Skipping ignored file: {entry.name}")
+            return ("skipped", None)
+        return self._organize(Path(entry.path), entry, category)
 
     def run(self):
         """Run the file organizer on all configured directories"""
@@ -220,32 +511,36 @@ class FileOrganizer:
         self.logger.info("=" * 60)
         self.logger.info("Organization Complete!")
         self.logger.info(f"Files moved: {self.stats['moved']}")
+        for category, count in sorted(self.moved_by_category.items()):
+            self.logger.info(f"  {category}: {count}")
         self.logger.info(f"Files skipped: {self.stats['skipped']}")
         self.logger.info(f"Errors: {self.stats['errors']}")
         self.logger.info("=" * 60)
 
     def print_config_info(self):
         """Print configuration information"""
-        print("\n" + "=" * 60)
-        print("FILE ORGANIZER CONFIGURATION")
-        print("=" * 60)
-        print(f"\nWatching directories:")
+        # Build the whole report first so it goes out in a single write
+        lines = ["\n" + "=" * 60, "FILE ORGANIZER CONFIGURATION", "=" * 60]
+        lines.append("\nWatching directories:")
         for directory in self.config.get("watch_directories", []):
-            print(f"  - {directory}")
+            lines.append(f"  - {directory}")
 
-        print(f"\nOrganization rules:")
+        lines.append("\nOrganization rules:")
         for category, rules in self.config.get("organize_rules", {}).items():
-            print(f"  {category}:")
-            print(f"    Target: {rules['target_folder']}")
-            print(f"    Extensions: {', '.join(rules['extensions'])}")
+            lines.append(f"  {category}:")
+            lines.append(f"    Target: {rules['target_folder']}")
+            lines.append(f"    Extensions: {', '.join(rules['extensions'])}")
 
-        print(f"\nSettings:")
-        print(f"  Organize by date: {self.config.get('organize_by_date', False)}")
-        print(
+        lines.append("\nSettings:")
+        lines.append(
+            f"  Organize by date: {self.config.get('organize_by_date', False)}"
+        )
+        lines.append(
             f"  Duplicate handling: {self.config.get('duplicate_handling', 'rename')}"
         )
-        print(f"  Dry run: {self.config.get('dry_run', False)}")
-        print("=" * 60 + "\n")
+        lines.append(f"  Dry run: {self.config.get('dry_run', False)}")
+        lines.append("=" * 60 + "\n")
+        print("\n".join(lines))
 
 
 def main():
@@ -269,6 +564,7 @@ def main():
     # Override dry-run if specified
     if args.dry_run:
         organizer.config["dry_run"] = True
+        organizer._dry_run = True
 
     # Show config and exit if requested
     if args.show_config:
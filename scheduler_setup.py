@@ -6,6 +6,7 @@ Sets up automated tasks to run file organizer on schedule and at startup
 
 import os
 import sys
+import ctypes
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -25,14 +26,25 @@ class WindowsScheduler:
         self.file_organizer_script = self.script_dir / "file_organizer.py"
         self.watcher_script = self.script_dir / "watcher.py"
 
+        # Connected Task Scheduler service, reused across calls
+        self._scheduler = None
+        self._root_folder = None
+
+    def _connect(self):
+        """Connect to the Task Scheduler service once per instance"""
+        if self._root_folder is None:
+            scheduler = win32com.client.Dispatch("Schedule.Service")
+            scheduler.Connect()
+            self._root_folder = scheduler.GetFolder("\\")
+            self._scheduler = scheduler
+        return self._scheduler, self._root_folder
+
     def create_daily_task(
         self, task_name: str = "FileOrganizerDaily", time: str = "09:00"
     ):
         """Create a task that runs daily at a specific time"""
         try:
-            scheduler = win32com.client.Dispatch("Schedule.Service")
-            scheduler.Connect()
-            root_folder = scheduler.GetFolder("\\")
+            scheduler, root_folder = self._connect()
 
             # Create task definition
             task_def = scheduler.NewTask(0)
@@ -88,9 +100,7 @@ class WindowsScheduler:
     ):
         """Create a task that runs at system startup or user login"""
         try:
-            scheduler = win32com.client.Dispatch("Schedule.Service")
-            scheduler.Connect()
-            root_folder = scheduler.GetFolder("\\")
+            scheduler, root_folder = self._connect()
 
             # Create task definition
             task_def = scheduler.NewTask(0)
@@ -160,9 +170,7 @@ class WindowsScheduler:
     def delete_task(self, task_name: str):
         """Delete a scheduled task"""
         try:
-            scheduler = win32com.client.Dispatch("Schedule.Service")
-            scheduler.Connect()
-            root_folder = scheduler.GetFolder("\\")
+            _, root_folder = self._connect()
             root_folder.DeleteTask(task_name, 0)
             print(f"✓ Task '{task_name}' deleted successfully!")
             return True
@@ -173,9 +181,7 @@ class WindowsScheduler:
     def list_tasks(self):
         """List all file organizer related tasks"""
         try:
-            scheduler = win32com.client.Dispatch("Schedule.Service")
-            scheduler.Connect()
-            root_folder = scheduler.GetFolder("\\")
+            _, root_folder = self._connect()
             tasks = root_folder.GetTasks(0)
 
             print("\nFile Organizer Tasks:")
@@ -215,6 +221,14 @@ class WindowsScheduler:
         return scheduled.strftime("%Y-%m-%dT%H:%M:%S")
 
 
+def is_admin() -> bool:
+    """Check if the current process has administrator privileges"""
+    try:
+        return ctypes.windll.shell32.IsUserAnAdmin() != 0
+    except Exception:
+        return False
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -248,14 +262,7 @@ def main():
     args = parser.parse_args()
 
     # Check if running with admin privileges
-    try:
-        import ctypes
-
-        is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
-    except:
-        is_admin = False
-
-    if not is_admin:
+    if not is_admin():
         print("⚠ Warning: Not running as administrator")
         print("  Some operations may require elevated privileges")
         print()
@@ -283,17 +290,23 @@ def main():
         scheduler.create_startup_task(run_watcher=True)
 
     else:
-        # Interactive mode
-        print("\n" + "=" * 60)
-        print("FILE ORGANIZER - TASK SCHEDULER SETUP")
-        print("=" * 60)
-        print("\nWhat would you like to do?")
-        print("  1) Setup daily organization task")
-        print("  2) Setup startup watcher (recommended)")
-        print("  3) Setup both (daily + startup)")
-        print("  4) List existing tasks")
-        print("  5) Delete a task")
-        print("  6) Exit")
+        # Interactive mode, menu printed in a single write
+        print(
+            "\n".join(
+                [
+                    "\n" + "=" * 60,
+                    "FILE ORGANIZER - TASK SCHEDULER SETUP",
+                    "=" * 60,
+                    "\nWhat would you like to do?",
+                    "  1) Setup daily organization task",
+                    "  2) Setup startup watcher (recommended)",
+                    "  3) Setup both (daily + startup)",
+                    "  4) List existing tasks",
+                    "  5) Delete a task",
+                    "  6) Exit",
+                ]
+            )
+        )
 
         choice = input("\nEnter your choice (1-6): ").strip()
 
@@ -1,13 +1,32 @@
 import json
+import os
 import runpy
+import shutil
+import logging
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
 import file_organizer
 from file_organizer import FileOrganizer, main
 
+# Settings that don't depend on the per-test directory, built once per module
+BASE_SETTINGS = MappingProxyType(
+    {
+        "organize_by_date": False,
+        "date_format": "%Y-%m",
+        "ignore_extensions": [".tmp"],
+        "ignore_files": ["ignore.me"],
+        "duplicate_handling": "rename",
+        "recursive": False,
+        "dry_run": False,
+        "enable_logging": False,
+        "log_level": "INFO",
+    }
+)
+
 
 def write_config(tmp_path: Path, overrides: dict | None = None) -> Path:
     config = {
@@ -22,23 +41,39 @@ def write_config(tmp_path: Path, overrides: dict | None = None) -> Path:
                 "target_folder": str(tmp_path / "organized" / "Images"),
             },
         },
-        "organize_by_date": False,
-        "date_format": "%Y-%m",
-        "ignore_extensions": [".tmp"],
-        "ignore_files": ["ignore.me"],
-        "duplicate_handling": "rename",
-        "recursive": False,
-        "dry_run": False,
-        "enable_logging": False,
-        "log_level": "INFO",
-    }
-    if overrides:
-        config.update(overrides)
+        **BASE_SETTINGS,
+    } | (overrides or {})
     config_path = tmp_path / "config.json"
     config_path.write_text(json.dumps(config), encoding="utf-8")
     return config_path
 
 
+def seed_files(root: Path, files: dict) -> None:
+    """Create files relative to root, making each parent folder once"""
+    for parent in {(root / rel).parent for rel in files}:
+        os.makedirs(parent, exist_ok=True)
+    for rel, content in files.items():
+        (root / rel).write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def fake_move(monkeypatch) -> list:
+    """Record moves instead of touching the filesystem"""
+    moved = []
+
+    def record_move(self, file_path, target_path, entry=None):
+        moved.append((file_path, target_path))
+
+    monkeypatch.setattr(FileOrganizer, "_move_file", record_move)
+    return moved
+
+
+@pytest.fixture(scope="module")
+def shared_organizer(tmp_path_factory) -> FileOrganizer:
+    """Default-config organizer shared by tests that only classify names"""
+    return FileOrganizer(str(write_config(tmp_path_factory.mktemp("shared"))))
+
+
 def test_load_config_missing(tmp_path: Path):
     with pytest.raises(SystemExit):
         FileOrganizer(str(tmp_path / "missing.json"))
@@ -51,35 +86,117 @@ def test_load_config_invalid_json(tmp_path: Path):
         FileOrganizer(str(config_path))
 
 
-def test_get_file_category_ignored_extension(tmp_path: Path):
+def test_load_config_cached_until_file_changes(tmp_path: Path):
     config_path = write_config(tmp_path)
-    organizer = FileOrganizer(str(config_path))
-    file_path = tmp_path / "file.tmp"
-    file_path.write_text("x", encoding="utf-8")
+    first = FileOrganizer(str(config_path))
+    first.config["dry_run"] = True
+    second = FileOrganizer(str(config_path))
+    assert second.config["dry_run"] is False
+    assert second.config["organize_rules"] is first.config["organize_rules"]
+
+    write_config(tmp_path, {"recursive": True, "log_level": "DEBUG"})
+    third = FileOrganizer(str(config_path))
+    assert third.config["recursive"] is True
+
+
+def test_setup_logging_uses_queue_listener(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    config_path = write_config(tmp_path, {"enable_logging": True})
+
+    FileOrganizer(str(config_path))
+    listener = file_organizer._log_listener
+    try:
+        assert [type(h) for h in root.handlers] == [logging.handlers.QueueHandler]
+        assert len(listener.handlers) == 2
+    finally:
+        file_organizer._stop_log_listener()
+        for handler in listener.handlers:
+            handler.close()
+    assert file_organizer._log_listener is None
+
+
+def test_get_file_category_ignored_extension(shared_organizer):
+    organizer = shared_organizer
+    file_path = Path("watch") / "file.tmp"
     assert organizer._get_file_category(file_path) is None
 
 
-def test_get_file_category_ignored_file(tmp_path: Path):
-    config_path = write_config(tmp_path)
-    organizer = FileOrganizer(str(config_path))
-    file_path = tmp_path / "ignore.me"
-    file_path.write_text("x", encoding="utf-8")
+def test_get_file_category_ignored_file(shared_organizer):
+    organizer = shared_organizer
+    file_path = Path("watch") / "ignore.me"
     assert organizer._get_file_category(file_path) is None
 
 
-def test_get_file_category_extras(tmp_path: Path):
-    config_path = write_config(tmp_path)
-    organizer = FileOrganizer(str(config_path))
-    file_path = tmp_path / "file.unknown"
-    file_path.write_text("x", encoding="utf-8")
+def test_get_file_category_extras(shared_organizer):
+    organizer = shared_organizer
+    file_path = Path("watch") / "file.unknown"
     assert organizer._get_file_category(file_path) == "Extras"
 
 
+def test_get_file_category_first_rule_wins(tmp_path: Path):
+    rules = {
+        "Documents": {"extensions": [".TXT"], "target_folder": str(tmp_path / "d")},
+        "Notes": {"extensions": [".txt"], "target_folder": str(tmp_path / "n")},
+    }
+    config_path = write_config(tmp_path, {"organize_rules": rules})
+    organizer = FileOrganizer(str(config_path))
+    assert organizer._get_file_category(tmp_path / "notes.Txt") == "Documents"
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["doc.txt", "DOC.TXT", ".txt", ".tmp", "file.", "README", "a.b.png", ".hidden.tmp"],
+)
+def test_category_for_name_matches_path_suffix(shared_organizer, name: str):
+    organizer = shared_organizer
+    suffix = Path(name).suffix.lower()
+    if suffix in organizer._ignore_exts:
+        expected = None
+    else:
+        expected = organizer._ext_to_category.get(suffix, "Extras")
+    assert organizer._category_for_name(name) == expected
+
+
+def test_category_for_name_empty_ignore_extension(tmp_path: Path):
+    organizer = FileOrganizer(str(write_config(tmp_path, {"ignore_extensions": [""]})))
+    assert organizer._category_for_name("README") is None
+    assert organizer._category_for_name("file.") is None
+    assert organizer._category_for_name("doc.txt") == "Documents"
+    assert organizer._category_for_name("photo.png") == "Images"
+
+
+def test_category_for_name_undotted_ignore_extension(tmp_path: Path):
+    config_path = write_config(tmp_path, {"ignore_extensions": ["tmp"]})
+    organizer = FileOrganizer(str(config_path))
+    # Like Path.suffix comparison, "tmp" never equals a dotted suffix
+    assert organizer._category_for_name("attempt") == "Extras"
+    assert organizer._category_for_name("file.tmp") == "Extras"
+
+
+def test_organize_directory_skips_ignored_names(tmp_path: Path):
+    config_path = write_config(tmp_path, {"ignore_extensions": [".PART", ".tar.gz"]})
+    organizer = FileOrganizer(str(config_path))
+    watch_dir = tmp_path / "watch"
+    watch_dir.mkdir()
+    for name in ("movie.mp4.part", "backup.tar.gz", "ignore.me", "doc.txt"):
+        (watch_dir / name).write_text("x", encoding="utf-8")
+
+    organizer.organize_directory(str(watch_dir))
+    assert organizer.stats == {"moved": 1, "skipped": 3, "errors": 0}
+    assert sorted(p.name for p in watch_dir.iterdir()) == [
+        "backup.tar.gz",
+        "ignore.me",
+        "movie.mp4.part",
+    ]
+
+
 def test_get_target_path_extras(tmp_path: Path):
     config_path = write_config(tmp_path)
     organizer = FileOrganizer(str(config_path))
     file_path = tmp_path / "file.unknown"
-    file_path.write_text("x", encoding="utf-8")
     target = organizer._get_target_path(file_path, "Extras")
     assert target.parent.name == "Extras"
 
@@ -88,7 +205,6 @@ def test_get_target_path_extras_default_folder(tmp_path: Path, monkeypatch):
     config_path = write_config(tmp_path, {"organize_rules": {}})
     organizer = FileOrganizer(str(config_path))
     file_path = tmp_path / "file.unknown"
-    file_path.write_text("x", encoding="utf-8")
 
     monkeypatch.setattr(file_organizer.Path, "mkdir", lambda *_a, **_k: None)
 
@@ -107,33 +223,79 @@ def test_get_target_path_with_date(tmp_path: Path):
     assert target.parent.name.count("-") == 1
 
 
-def test_handle_duplicate_skip(tmp_path: Path):
-    config_path = write_config(tmp_path, {"duplicate_handling": "skip"})
+def test_get_target_path_creates_folder_once(tmp_path: Path, monkeypatch):
+    config_path = write_config(tmp_path)
     organizer = FileOrganizer(str(config_path))
-    target = tmp_path / "organized" / "Documents" / "file.txt"
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text("a", encoding="utf-8")
-    assert organizer._handle_duplicate(target) is None
+    (tmp_path / "organized").mkdir()
+    calls = []
+    original_mkdir = file_organizer.Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        calls.append(self)
+        return original_mkdir(self, *args, **kwargs)
 
+    monkeypatch.setattr(file_organizer.Path, "mkdir", counting_mkdir)
 
-def test_handle_duplicate_overwrite(tmp_path: Path):
-    config_path = write_config(tmp_path, {"duplicate_handling": "overwrite"})
+    organizer._get_target_path(tmp_path / "a.txt", "Documents")
+    organizer._get_target_path(tmp_path / "b.txt", "Documents")
+    assert calls == [tmp_path / "organized" / "Documents"]
+
+
+def test_date_subfolder_cached_per_bucket(tmp_path: Path):
+    config_path = write_config(tmp_path, {"date_format": "%Y-%m-%d"})
+    organizer = FileOrganizer(str(config_path))
+    mtime = 1_700_000_100.0
+
+    expected = file_organizer.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
+    assert organizer._date_subfolder(mtime) == expected
+    assert organizer._date_subfolder(mtime + 1) == expected
+    assert list(organizer._date_bucket_cache.values()) == [expected]
+
+
+def test_date_subfolder_with_time_not_cached(tmp_path: Path):
+    config_path = write_config(tmp_path, {"date_format": "%Y-%m-%d_%H%M"})
+    organizer = FileOrganizer(str(config_path))
+    mtime = 1_700_000_100.0
+
+    assert organizer._date_subfolder(mtime) != organizer._date_subfolder(mtime + 60)
+    assert organizer._date_bucket_cache == {}
+
+
+@pytest.mark.parametrize(
+    "mode, expected_name",
+    [("skip", None), ("overwrite", "file.txt"), ("rename", "file_1.txt")],
+)
+def test_handle_duplicate(tmp_path: Path, mode: str, expected_name: str | None):
+    config_path = write_config(tmp_path, {"duplicate_handling": mode})
     organizer = FileOrganizer(str(config_path))
+    seed_files(tmp_path, {"organized/Documents/file.txt": "a"})
     target = tmp_path / "organized" / "Documents" / "file.txt"
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text("a", encoding="utf-8")
-    assert organizer._handle_duplicate(target) == target
+
+    result = organizer._handle_duplicate(target)
+    if expected_name is None:
+        assert result is None
+    else:
+        assert result == target.parent / expected_name
 
 
-def test_handle_duplicate_rename(tmp_path: Path):
+def test_handle_duplicate_rename_uses_name_cache(tmp_path: Path, monkeypatch):
     config_path = write_config(tmp_path, {"duplicate_handling": "rename"})
     organizer = FileOrganizer(str(config_path))
     target = tmp_path / "organized" / "Documents" / "file.txt"
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text("a", encoding="utf-8")
-    new_target = organizer._handle_duplicate(target)
-    assert new_target is not None
-    assert new_target.name.startswith("file_")
+    for name in ("file.txt", "file_1.txt", "file_2.txt"):
+        (target.parent / name).write_text("a", encoding="utf-8")
+
+    assert organizer._handle_duplicate(target).name == "file_3.txt"
+
+    # A file created after the listing was cached is still not overwritten
+    (target.parent / "file_4.txt").write_text("a", encoding="utf-8")
+    assert organizer._handle_duplicate(target).name == "file_5.txt"
+
+    listdir_calls = []
+    monkeypatch.setattr(file_organizer.os, "listdir", listdir_calls.append)
+    assert organizer._handle_duplicate(target).name == "file_6.txt"
+    assert listdir_calls == []
 
 
 def test_organize_file_dry_run(tmp_path: Path):
@@ -149,7 +311,7 @@ def test_organize_file_dry_run(tmp_path: Path):
     assert organizer.stats["moved"] == 1
 
 
-def test_organize_file_move(tmp_path: Path):
+def test_organize_file_move(tmp_path: Path, fake_move):
     config_path = write_config(tmp_path)
     organizer = FileOrganizer(str(config_path))
     src_dir = tmp_path / "watch"
@@ -159,10 +321,114 @@ def test_organize_file_move(tmp_path: Path):
 
     assert organizer.organize_file(file_path) is True
     target = tmp_path / "organized" / "Documents" / "doc.txt"
-    assert target.exists()
+    assert fake_move == [(file_path, target)]
     assert organizer.stats["moved"] == 1
 
 
+def test_organize_file_counts_by_category(tmp_path: Path, fake_move):
+    config_path = write_config(tmp_path)
+    organizer = FileOrganizer(str(config_path))
+    src_dir = tmp_path / "watch"
+    src_dir.mkdir()
+    for name in ("a.txt", "b.txt", "c.png"):
+        (src_dir / name).write_text("x", encoding="utf-8")
+        organizer.organize_file(src_dir / name)
+
+    assert organizer.moved_by_category == {"Documents": 2, "Images": 1}
+
+
+def test_organize_files_batch(tmp_path: Path, fake_move):
+    organizer = FileOrganizer(str(write_config(tmp_path)))
+    src_dir = tmp_path / "watch"
+    seed_files(src_dir, {"a.txt": "x", "b.png": "x", "c.txt": "x", "d.tmp": "x"})
+    (src_dir / "folder").mkdir()
+
+    names = ["b.png", "a.txt", "d.tmp", "folder", "c.txt"]
+    assert organizer.organize_files([src_dir / name for name in names]) == 3
+
+    organized = tmp_path / "organized"
+    assert [target for _src, target in fake_move] == [
+        organized / "Documents" / "a.txt",
+        organized / "Documents" / "c.txt",
+        organized / "Images" / "b.png",
+    ]
+    assert organizer.stats["moved"] == 3
+    assert organizer.stats["skipped"] == 1
+    assert organizer.moved_by_category == {"Documents": 2, "Images": 1}
+
+
+def test_organize_file_recreates_deleted_target_folder(tmp_path: Path):
+    organizer = FileOrganizer(str(write_config(tmp_path)))
+    src_dir = tmp_path / "watch"
+    seed_files(src_dir, {"a.txt": "a", "b.txt": "b"})
+
+    assert organizer.organize_file(src_dir / "a.txt") is True
+    shutil.rmtree(tmp_path / "organized")
+
+    assert organizer.organize_file(src_dir / "b.txt") is True
+    assert (tmp_path / "organized" / "Documents" / "b.txt").exists()
+    assert not (src_dir / "b.txt").exists()
+    assert organizer.stats["errors"] == 0
+
+
+def test_organize_file_same_device_uses_replace(tmp_path: Path, monkeypatch):
+    config_path = write_config(tmp_path)
+    organizer = FileOrganizer(str(config_path))
+    src_dir = tmp_path / "watch"
+    src_dir.mkdir()
+    file_path = src_dir / "doc.txt"
+    file_path.write_text("hello", encoding="utf-8")
+
+    def fail_move(*_args, **_kwargs):
+        raise AssertionError("shutil.move should not be used")
+
+    monkeypatch.setattr("shutil.move", fail_move)
+    assert organizer.organize_file(file_path) is True
+    assert (tmp_path / "organized" / "Documents" / "doc.txt").exists()
+
+
+def test_organize_file_cross_device_uses_shutil(tmp_path: Path, monkeypatch):
+    config_path = write_config(tmp_path)
+    organizer = FileOrganizer(str(config_path))
+    src_dir = tmp_path / "watch"
+    src_dir.mkdir()
+    file_path = src_dir / "doc.txt"
+    file_path.write_text("hello", encoding="utf-8")
+    target_dir = tmp_path / "organized" / "Documents"
+    organizer._dev_cache[target_dir] = -1
+
+    moved = []
+    monkeypatch.setattr("shutil.move", lambda src, dst: moved.append((src, dst)))
+    assert organizer.organize_file(file_path) is True
+    assert moved == [(file_path, target_dir / "doc.txt")]
+
+
+def test_organize_file_cross_device_large_uses_copyfileex(tmp_path: Path, monkeypatch):
+    config_path = write_config(tmp_path)
+    organizer = FileOrganizer(str(config_path))
+    src_dir = tmp_path / "watch"
+    src_dir.mkdir()
+    file_path = src_dir / "doc.txt"
+    file_path.write_text("hello", encoding="utf-8")
+    target_dir = tmp_path / "organized" / "Documents"
+    organizer._dev_cache[target_dir] = -1
+
+    copied = []
+
+    def fake_copy(src, dst, _progress, _data, _cancel, flags):
+        copied.append(flags)
+        Path(dst).write_bytes(Path(src).read_bytes())
+
+    fake_win32file = type("FakeWin32File", (), {"CopyFileEx": staticmethod(fake_copy)})
+    monkeypatch.setattr(file_organizer, "win32file", fake_win32file)
+    monkeypatch.setattr(file_organizer, "LARGE_FILE_BYTES", 1)
+
+    assert organizer.organize_file(file_path) is True
+    assert copied == [file_organizer.COPY_FILE_NO_BUFFERING]
+    assert not file_path.exists()
+    assert (target_dir / "doc.txt").read_text(encoding="utf-8") == "hello"
+
+
 def test_organize_file_ignored(tmp_path: Path):
     config_path = write_config(tmp_path)
     organizer = FileOrganizer(str(config_path))
@@ -176,14 +442,11 @@ def test_organize_file_ignored(tmp_path: Path):
 def test_organize_file_duplicate_skipped(tmp_path: Path):
     config_path = write_config(tmp_path, {"duplicate_handling": "skip"})
     organizer = FileOrganizer(str(config_path))
-    src_dir = tmp_path / "watch"
-    src_dir.mkdir()
-    file_path = src_dir / "doc.txt"
-    file_path.write_text("hello", encoding="utf-8")
-
-    target = tmp_path / "organized" / "Documents" / "doc.txt"
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text("existing", encoding="utf-8")
+    seed_files(
+        tmp_path,
+        {"watch/doc.txt": "hello", "organized/Documents/doc.txt": "existing"},
+    )
+    file_path = tmp_path / "watch" / "doc.txt"
 
     assert organizer.organize_file(file_path) is False
     assert organizer.stats["skipped"] == 1
@@ -209,7 +472,7 @@ def test_organize_file_permission_error(tmp_path: Path, monkeypatch):
     def raise_permission_error(*_args, **_kwargs):
         raise PermissionError("no")
 
-    monkeypatch.setattr("shutil.move", raise_permission_error)
+    monkeypatch.setattr(organizer, "_move_file", raise_permission_error)
     assert organizer.organize_file(file_path) is False
     assert organizer.stats["errors"] == 1
 
@@ -225,7 +488,7 @@ def test_organize_file_generic_error(tmp_path: Path, monkeypatch):
     def raise_error(*_args, **_kwargs):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr("shutil.move", raise_error)
+    monkeypatch.setattr(organizer, "_move_file", raise_error)
     assert organizer.organize_file(file_path) is False
     assert organizer.stats["errors"] == 1
 
@@ -246,32 +509,88 @@ def test_organize_directory_not_dir(tmp_path: Path):
     assert organizer.stats == {"moved": 0, "skipped": 0, "errors": 0}
 
 
-def test_organize_directory_recursive(tmp_path: Path):
+def test_organize_directory_recursive(tmp_path: Path, fake_move):
     config_path = write_config(tmp_path, {"recursive": True})
     organizer = FileOrganizer(str(config_path))
+    seed_files(tmp_path, {"watch/nested/doc.txt": "hello"})
     watch_dir = tmp_path / "watch"
-    nested = watch_dir / "nested"
-    nested.mkdir(parents=True)
-    file_path = nested / "doc.txt"
-    file_path.write_text("hello", encoding="utf-8")
+    file_path = watch_dir / "nested" / "doc.txt"
 
     organizer.organize_directory(str(watch_dir))
     target = tmp_path / "organized" / "Documents" / "doc.txt"
-    assert target.exists()
+    assert fake_move == [(file_path, target)]
+
+
+def test_organize_directory_skips_unreadable_subdir(tmp_path: Path, monkeypatch):
+    config_path = write_config(tmp_path, {"recursive": True})
+    organizer = FileOrganizer(str(config_path))
+    watch_dir = tmp_path / "watch"
+    locked = watch_dir / "locked"
+    locked.mkdir(parents=True)
+    (watch_dir / "doc.txt").write_text("hello", encoding="utf-8")
+
+    original_scandir = file_organizer.os.scandir
 
+    def fake_scandir(path):
+        if Path(path).name == "locked":
+            raise PermissionError("no")
+        return original_scandir(path)
+
+    monkeypatch.setattr(file_organizer.os, "scandir", fake_scandir)
+    organizer.organize_directory(str(watch_dir))
+    assert (tmp_path / "organized" / "Documents" / "doc.txt").exists()
 
-def test_organize_directory_non_recursive(tmp_path: Path):
+
+def test_organize_directory_parallel_same_names(tmp_path: Path):
+    config_path = write_config(tmp_path, {"recursive": True, "max_workers": 4})
+    organizer = FileOrganizer(str(config_path))
+    for name in ("a", "b", "c"):
+        nested = tmp_path / "watch" / name
+        nested.mkdir(parents=True)
+        (nested / "doc.txt").write_text(name, encoding="utf-8")
+
+    organizer.organize_directory(str(tmp_path / "watch"))
+    target_dir = tmp_path / "organized" / "Documents"
+    contents = sorted(p.read_text(encoding="utf-8") for p in target_dir.iterdir())
+    assert contents == ["a", "b", "c"]
+    assert organizer.stats["moved"] == 3
+
+
+def test_organize_directory_parallel_walk_stays_lazy(tmp_path: Path, monkeypatch):
+    config_path = write_config(tmp_path, {"max_workers": 2})
+    organizer = FileOrganizer(str(config_path))
+    (tmp_path / "watch").mkdir()
+    consumed = []
+    lead = []
+
+    def fake_iter_files(_dir_path, _recursive):
+        for index in range(100):
+            consumed.append(index)
+            yield index
+
+    def fake_organize_entry(index):
+        # How far the walk has run ahead of the entry being organized
+        lead.append(len(consumed) - index)
+        return ("skipped", None)
+
+    monkeypatch.setattr(organizer, "_iter_files", fake_iter_files)
+    monkeypatch.setattr(organizer, "_organize_entry", fake_organize_entry)
+    organizer.organize_directory(str(tmp_path / "watch"))
+
+    assert organizer.stats["skipped"] == 100
+    assert max(lead) <= 2 * 4
+
+
+def test_organize_directory_non_recursive(tmp_path: Path, fake_move):
     config_path = write_config(tmp_path, {"recursive": False})
     organizer = FileOrganizer(str(config_path))
+    seed_files(tmp_path, {"watch/nested/doc.txt": "hello"})
     watch_dir = tmp_path / "watch"
-    nested = watch_dir / "nested"
-    nested.mkdir(parents=True)
-    file_path = nested / "doc.txt"
-    file_path.write_text("hello", encoding="utf-8")
+    file_path = watch_dir / "nested" / "doc.txt"
 
     organizer.organize_directory(str(watch_dir))
-    target = tmp_path / "organized" / "Documents" / "doc.txt"
-    assert not target.exists()
+    assert fake_move == []
+    assert file_path.exists()
 
 
 def test_run_no_watch_dirs(tmp_path: Path):
@@ -325,6 +644,7 @@ def test_main_dry_run_sets_flag(tmp_path: Path, monkeypatch):
     def fake_run(self):
         called["run"] = True
         assert self.config["dry_run"] is True
+        assert self._dry_run is True
 
     monkeypatch.setattr(FileOrganizer, "run", fake_run)
     main()
@@ -341,3 +661,17 @@ def test_module_entrypoint(tmp_path: Path, monkeypatch, capsys):
     runpy.run_module("file_organizer", run_name="__main__")
     captured = capsys.readouterr()
     assert "FILE ORGANIZER CONFIGURATION" in captured.out
+
+
+def test_organize_directory_recursive_skips_target_folder(tmp_path: Path):
+    target_dir = tmp_path / "watch" / "Documents"
+    rules = {"Documents": {"extensions": [".txt"], "target_folder": str(target_dir)}}
+    config_path = write_config(tmp_path, {"recursive": True, "organize_rules": rules})
+    organizer = FileOrganizer(str(config_path))
+    target_dir.mkdir(parents=True)
+    (target_dir / "already.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "watch" / "doc.txt").write_text("hello", encoding="utf-8")
+
+    organizer.organize_directory(str(tmp_path / "watch"))
+    assert sorted(p.name for p in target_dir.iterdir()) == ["already.txt", "doc.txt"]
+    assert organizer.stats["moved"] == 1
@@ -1,3 +1,4 @@
+import runpy
 import sys
 import types
 import datetime as datetime_module
@@ -108,21 +109,40 @@ class DummyScheduler:
 class DummyClient:
     def __init__(self, folder: DummyFolder):
         self.folder = folder
+        self.dispatched = 0
 
     def Dispatch(self, _name):
+        self.dispatched += 1
         return DummyScheduler(self.folder)
 
 
-def test_create_daily_task_success(monkeypatch, tmp_path: Path):
+@pytest.fixture
+def dummy_env(monkeypatch):
     folder = DummyFolder()
     dummy_client = DummyClient(folder)
     monkeypatch.setattr(scheduler_setup.win32com, "client", dummy_client)
+    return folder, dummy_client
+
+
+def test_create_daily_task_success(dummy_env, tmp_path: Path):
+    folder, _ = dummy_env
 
     scheduler = scheduler_setup.WindowsScheduler(str(tmp_path))
     assert scheduler.create_daily_task(task_name="TestDaily", time="10:00") is True
     assert folder.registered
 
 
+def test_scheduler_connects_once(dummy_env, tmp_path: Path):
+    folder, dummy_client = dummy_env
+
+    scheduler = scheduler_setup.WindowsScheduler(str(tmp_path))
+    assert scheduler.create_daily_task(task_name="TestDaily") is True
+    assert scheduler.create_startup_task(task_name="TestStartup") is True
+    assert scheduler.list_tasks() is True
+    assert dummy_client.dispatched == 1
+    assert len(folder.registered) == 2
+
+
 def test_create_daily_task_failure(monkeypatch, tmp_path: Path):
     def raise_error(_name):
         raise RuntimeError("boom")
@@ -135,10 +155,8 @@ def test_create_daily_task_failure(monkeypatch, tmp_path: Path):
     assert scheduler.create_daily_task(task_name="TestDaily") is False
 
 
-def test_create_startup_task_success(monkeypatch, tmp_path: Path):
-    folder = DummyFolder()
-    dummy_client = DummyClient(folder)
-    monkeypatch.setattr(scheduler_setup.win32com, "client", dummy_client)
+def test_create_startup_task_success(dummy_env, tmp_path: Path):
+    folder, _ = dummy_env
 
     scheduler = scheduler_setup.WindowsScheduler(str(tmp_path))
     assert (
@@ -147,10 +165,8 @@ def test_create_startup_task_success(monkeypatch, tmp_path: Path):
     assert folder.registered
 
 
-def test_create_startup_task_success_no_watcher(monkeypatch, tmp_path: Path):
-    folder = DummyFolder()
-    dummy_client = DummyClient(folder)
-    monkeypatch.setattr(scheduler_setup.win32com, "client", dummy_client)
+def test_create_startup_task_success_no_watcher(dummy_env, tmp_path: Path):
+    folder, _ = dummy_env
 
     scheduler = scheduler_setup.WindowsScheduler(str(tmp_path))
     assert (
@@ -175,10 +191,8 @@ def test_create_startup_task_failure(monkeypatch, tmp_path: Path):
     )
 
 
-def test_delete_task_success(monkeypatch, tmp_path: Path):
-    folder = DummyFolder()
-    dummy_client = DummyClient(folder)
-    monkeypatch.setattr(scheduler_setup.win32com, "client", dummy_client)
+def test_delete_task_success(dummy_env, tmp_path: Path):
+    folder, _ = dummy_env
 
     scheduler = scheduler_setup.WindowsScheduler(str(tmp_path))
     assert scheduler.delete_task("TestTask") is True
@@ -197,11 +211,9 @@ def test_delete_task_failure(monkeypatch, tmp_path: Path):
     assert scheduler.delete_task("TestTask") is False
 
 
-def test_list_tasks(monkeypatch, tmp_path: Path, capsys):
-    folder = DummyFolder()
+def test_list_tasks(dummy_env, tmp_path: Path, capsys):
+    folder, _ = dummy_env
     folder.tasks = [DummyTask("FileOrganizerDaily", True), DummyTask("Other", False)]
-    dummy_client = DummyClient(folder)
-    monkeypatch.setattr(scheduler_setup.win32com, "client", dummy_client)
 
     scheduler = scheduler_setup.WindowsScheduler(str(tmp_path))
     assert scheduler.list_tasks() is True
@@ -209,11 +221,9 @@ def test_list_tasks(monkeypatch, tmp_path: Path, capsys):
     assert "FileOrganizerDaily" in captured.out
 
 
-def test_list_tasks_none_found(monkeypatch, tmp_path: Path, capsys):
-    folder = DummyFolder()
+def test_list_tasks_none_found(dummy_env, tmp_path: Path, capsys):
+    folder, _ = dummy_env
     folder.tasks = [DummyTask("Other", False)]
-    dummy_client = DummyClient(folder)
-    monkeypatch.setattr(scheduler_setup.win32com, "client", dummy_client)
 
     scheduler = scheduler_setup.WindowsScheduler(str(tmp_path))
     assert scheduler.list_tasks() is True
@@ -318,7 +328,7 @@ def test_main_not_admin_warning(monkeypatch, capsys):
             shell32=types.SimpleNamespace(IsUserAnAdmin=lambda: 0)
         )
     )
-    monkeypatch.setitem(sys.modules, "ctypes", dummy_ctypes)
+    monkeypatch.setattr(scheduler_setup, "ctypes", dummy_ctypes)
     monkeypatch.setattr(sys, "argv", ["scheduler_setup.py", "--list"])
 
     def fake_list(self):
@@ -330,13 +340,23 @@ def test_main_not_admin_warning(monkeypatch, capsys):
     assert "Not running as administrator" in captured.out
 
 
+def test_is_admin_true(monkeypatch):
+    dummy_ctypes = types.SimpleNamespace(
+        windll=types.SimpleNamespace(
+            shell32=types.SimpleNamespace(IsUserAnAdmin=lambda: 1)
+        )
+    )
+    monkeypatch.setattr(scheduler_setup, "ctypes", dummy_ctypes)
+    assert scheduler_setup.is_admin() is True
+
+
 def test_main_admin_check_exception(monkeypatch):
     class BrokenCtypes:
         @property
         def windll(self):
             raise RuntimeError("boom")
 
-    monkeypatch.setitem(sys.modules, "ctypes", BrokenCtypes())
+    monkeypatch.setattr(scheduler_setup, "ctypes", BrokenCtypes())
     monkeypatch.setattr(sys, "argv", ["scheduler_setup.py", "--list"])
 
     def fake_list(self):
@@ -346,75 +366,67 @@ def test_main_admin_check_exception(monkeypatch):
     scheduler_setup.main()
 
 
-def test_main_interactive_choices(monkeypatch):
-    monkeypatch.setattr(sys, "argv", ["scheduler_setup.py"])
-
+@pytest.fixture
+def scheduler_calls(monkeypatch):
     calls = {"daily": 0, "startup": 0, "list": 0, "delete": 0}
 
-    def fake_daily(self, *args, **kwargs):
-        calls["daily"] += 1
-        return True
-
-    def fake_startup(self, *args, **kwargs):
-        calls["startup"] += 1
-        return True
-
-    def fake_list(self, *args, **kwargs):
-        calls["list"] += 1
-        return True
-
-    def fake_delete(self, *args, **kwargs):
-        calls["delete"] += 1
-        return True
-
-    monkeypatch.setattr(
-        scheduler_setup.WindowsScheduler, "create_daily_task", fake_daily
-    )
-    monkeypatch.setattr(
-        scheduler_setup.WindowsScheduler, "create_startup_task", fake_startup
-    )
-    monkeypatch.setattr(scheduler_setup.WindowsScheduler, "list_tasks", fake_list)
-    monkeypatch.setattr(scheduler_setup.WindowsScheduler, "delete_task", fake_delete)
-
-    inputs = iter(
-        [
-            "1",  # choice daily
-            "",  # default time
-            "2",  # startup
-            "3",  # both
-            "",  # default time
-            "4",  # list
-            "5",  # delete
-            "TaskName",
-            "7",  # invalid
-            "6",  # exit
-        ]
-    )
-
-    monkeypatch.setattr("builtins.input", lambda _prompt: next(inputs))
+    def make_fake(key):
+        def fake(self, *args, **kwargs):
+            calls[key] += 1
+            return True
+
+        return fake
+
+    for key, method in (
+        ("daily", "create_daily_task"),
+        ("startup", "create_startup_task"),
+        ("list", "list_tasks"),
+        ("delete", "delete_task"),
+    ):
+        monkeypatch.setattr(scheduler_setup.WindowsScheduler, method, make_fake(key))
+    return calls
+
+
+@pytest.mark.parametrize(
+    "inputs, expected",
+    [
+        (["1", ""], {"daily": 1}),  # daily, default time
+        (["2"], {"startup": 1}),
+        (["3", ""], {"daily": 1, "startup": 1}),  # both, default time
+        (["4"], {"list": 1}),
+        (["5", "TaskName"], {"delete": 1}),
+        (["5", ""], {}),  # delete without a name
+        (["7"], {}),  # invalid
+        (["6"], {}),  # exit
+    ],
+)
+def test_main_interactive_choices(monkeypatch, scheduler_calls, inputs, expected):
+    monkeypatch.setattr(sys, "argv", ["scheduler_setup.py"])
+    answers = iter(inputs)
+    monkeypatch.setattr("builtins.input", lambda _prompt: next(answers))
 
-    scheduler_setup.main()
-    scheduler_setup.main()
-    scheduler_setup.main()
-    scheduler_setup.main()
-    scheduler_setup.main()
-    scheduler_setup.main()
     scheduler_setup.main()
 
-    assert calls["daily"] >= 2
-    assert calls["startup"] >= 2
-    assert calls["list"] == 1
-    assert calls["delete"] == 1
+    assert scheduler_calls == {
+        "daily": 0,
+        "startup": 0,
+        "list": 0,
+        "delete": 0,
+        **expected,
+    }
+    assert next(answers, None) is None
 
 
-def test_module_entrypoint(monkeypatch):
+def test_module_entrypoint(monkeypatch, capsys):
     monkeypatch.setattr(sys, "argv", ["scheduler_setup.py", "--list"])
 
-    folder = DummyFolder()
-    dummy_client = DummyClient(folder)
+    # runpy re-imports win32com.client, so stub it where the import finds it
+    dummy_client = DummyClient(DummyFolder())
     dummy_win32com = types.SimpleNamespace(client=dummy_client)
     monkeypatch.setitem(sys.modules, "win32com", dummy_win32com)
-
-    import runpy
+    monkeypatch.setitem(sys.modules, "win32com.client", dummy_client)
 
     runpy.run_module("scheduler_setup", run_name="__main__")
+    captured = capsys.readouterr()
+    assert "No tasks found" in captured.out
+    assert dummy_client.dispatched == 1
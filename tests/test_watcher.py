@@ -1,5 +1,9 @@
 from pathlib import Path
+import errno
 import json
+import os
+import runpy
+import signal
 import sys
 from typing import cast
 
@@ -11,10 +15,15 @@ import watcher
 class DummyOrganizer:
     def __init__(self):
         self.called = []
+        self.batches = []
 
     def organize_file(self, file_path: Path):
         self.called.append(file_path)
 
+    def organize_files(self, file_paths):
+        self.batches.append(list(file_paths))
+        self.called.extend(file_paths)
+
 
 class DummyObserver:
     def __init__(self):
@@ -35,6 +44,24 @@ class DummyObserver:
     def join(self):
         self.joined = True
 
+    def unschedule_all(self):
+        self.scheduled = []
+
+
+class ExhaustedObserver(DummyObserver):
+    def __init__(self, errno_value=errno.ENOSPC):
+        super().__init__()
+        self.errno_value = errno_value
+
+    def start(self):
+        raise OSError(self.errno_value, "inotify watch limit reached")
+
+
+class DummyPollingObserver(DummyObserver):
+    def __init__(self, timeout=None):
+        super().__init__()
+        self.timeout = timeout
+
 
 class DummyEvent:
     def __init__(self, src_path=None, dest_path=None, is_directory=False):
@@ -43,43 +70,38 @@ class DummyEvent:
         self.is_directory = is_directory
 
 
-def test_handler_process_file_stable(tmp_path: Path, monkeypatch):
+def canonical(path: Path) -> str:
+    """The pending key the handler uses for a path"""
+    return os.path.join(os.path.realpath(path.parent), path.name)
+
+
+def test_handler_check_file_stable(tmp_path: Path):
     organizer = DummyOrganizer()
     handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
 
     file_path = tmp_path / "file.txt"
     file_path.write_text("hello", encoding="utf-8")
 
-    monkeypatch.setattr(watcher.time, "sleep", lambda _t: None)
-
-    handler._process_file(file_path, "created")
-    assert organizer.called == [file_path]
+    assert handler._check_file(canonical(file_path), 5) == ("ready", None)
 
 
-def test_handler_process_file_size_changes(tmp_path: Path, monkeypatch):
+def test_handler_check_file_size_changes(tmp_path: Path, monkeypatch):
     organizer = DummyOrganizer()
     handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
 
     file_path = tmp_path / "file.txt"
     file_path.write_text("hello", encoding="utf-8")
 
-    calls = {"count": 0}
-
-    def fake_sleep(_t):
-        calls["count"] += 1
-        if calls["count"] == 2:
-            file_path.write_text("hello world", encoding="utf-8")
-
     debug_called = {"count": 0}
 
-    def fake_debug(_msg):
+    def fake_debug(_msg, name):
+        assert name == "file.txt"
         debug_called["count"] += 1
 
     monkeypatch.setattr(handler.logger, "debug", fake_debug)
-    monkeypatch.setattr(watcher.time, "sleep", fake_sleep)
 
-    handler._process_file(file_path, "created")
-    assert organizer.called == []
+    file_path.write_text("hello world", encoding="utf-8")
+    assert handler._check_file(canonical(file_path), 5) == ("growing", 11)
     assert debug_called["count"] == 1
 
 
@@ -89,11 +111,29 @@ def test_handler_skip_if_processing(tmp_path: Path, monkeypatch):
 
     file_path = tmp_path / "file.txt"
     file_path.write_text("hello", encoding="utf-8")
-    handler.processing_files.add(str(file_path))
+    key = canonical(file_path)
+    handler.processing_files[key] = watcher.time.monotonic()
 
-    monkeypatch.setattr(watcher.time, "sleep", lambda _t: None)
-    handler._process_file(file_path, "created")
-    assert organizer.called == []
+    assert handler._check_file(key, 5) == ("dropped", None)
+
+
+def test_handler_processing_entries_expire(tmp_path: Path, monkeypatch):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("hello", encoding="utf-8")
+    key = canonical(file_path)
+    stale = watcher.time.monotonic() - watcher.PROCESSING_TTL
+    handler.processing_files["old"] = stale
+    handler.processing_files[key] = stale
+
+    assert handler._check_file(key, 5) == ("ready", None)
+    assert handler.processing_files == {}
+    handler._organize_ready([(key, "created")])
+
+    assert organizer.called == [file_path]
+    assert list(handler.processing_files) == [key]
 
 
 def test_on_created_ignores_directory(tmp_path: Path):
@@ -126,7 +166,7 @@ def test_on_created_processes_file(tmp_path: Path, monkeypatch):
     def fake_process(path, event_type):
         called["path"] = (path, event_type)
 
-    monkeypatch.setattr(handler, "_process_file", fake_process)
+    monkeypatch.setattr(handler, "_enqueue", fake_process)
 
     event = DummyEvent(src_path=str(file_path), is_directory=False)
     handler.on_created(event)
@@ -146,70 +186,246 @@ def test_on_moved_processes_file(tmp_path: Path, monkeypatch):
     def fake_process(path, event_type):
         called["path"] = (path, event_type)
 
-    monkeypatch.setattr(handler, "_process_file", fake_process)
+    monkeypatch.setattr(handler, "_enqueue", fake_process)
 
-    event = DummyEvent(dest_path=str(file_path), is_directory=False)
+    event = DummyEvent(
+        src_path=str(tmp_path / "file.part"),
+        dest_path=str(file_path),
+        is_directory=False,
+    )
     handler.on_moved(event)
     assert called["path"][0] == file_path
     assert called["path"][1] == "moved"
 
 
-def test_handler_process_file_missing(tmp_path: Path, monkeypatch):
+def test_handler_check_file_missing(tmp_path: Path):
     organizer = DummyOrganizer()
     handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
 
-    file_path = tmp_path / "missing.txt"
+    key = canonical(tmp_path / "missing.txt")
+    assert handler._check_file(key, 5) == ("dropped", None)
 
-    monkeypatch.setattr(watcher.time, "sleep", lambda _t: None)
 
-    handler._process_file(file_path, "created")
-    assert organizer.called == []
+def test_handler_enqueue_coalesces_events(tmp_path: Path):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
 
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("hello", encoding="utf-8")
+
+    handler._enqueue(file_path, "created")
+    file_path.write_text("hello world", encoding="utf-8")
+    handler._enqueue(file_path, "moved")
+
+    assert len(handler._deadlines) == 1
+    now = watcher.time.monotonic()
+    assert handler._pop_due(now) == []
+    assert 0 < handler._next_timeout(now) <= watcher.SETTLE_DELAY
+    assert handler._pop_due(now + watcher.SETTLE_DELAY) == [
+        (canonical(file_path), 5, "moved")
+    ]
+    assert handler._next_timeout(now) is None
 
-def test_handler_process_file_deleted_midway(tmp_path: Path, monkeypatch):
+
+def test_handler_moves_symlink_not_its_target(tmp_path: Path):
+    watch_dir = tmp_path / "watch"
+    outside_dir = tmp_path / "outside"
+    watch_dir.mkdir()
+    outside_dir.mkdir()
+    target = outside_dir / "important.txt"
+    target.write_text("hello", encoding="utf-8")
+    link_path = watch_dir / "link.txt"
+    try:
+        link_path.symlink_to(target)
+    except OSError:
+        pytest.skip("symlinks are not available")
+
+    organized = tmp_path / "organized" / "Documents"
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "watch_directories": [str(watch_dir)],
+                "organize_rules": {
+                    "Documents": {
+                        "extensions": [".txt"],
+                        "target_folder": str(organized),
+                    }
+                },
+                "enable_logging": False,
+            }
+        ),
+        encoding="utf-8",
+    )
+    handler = watcher.FileOrganizerHandler(watcher.FileOrganizer(str(config_path)))
+
+    handler.on_closed(DummyEvent(src_path=str(link_path)))
+    [(key, size, event_type)] = handler._pop_due(watcher.time.monotonic())
+    assert key == canonical(link_path)
+    assert handler._check_file(key, size) == ("ready", None)
+    handler._organize_ready([(key, event_type)])
+
+    assert target.read_text(encoding="utf-8") == "hello"
+    assert (organized / "link.txt").is_symlink()
+    assert not link_path.exists() and not link_path.is_symlink()
+
+
+def test_handler_processing_files_are_bounded(tmp_path: Path, monkeypatch):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+    monkeypatch.setattr(watcher, "PROCESSING_MAX", 2)
+
+    handler._organize_ready([(str(tmp_path / n), "created") for n in "abc"])
+
+    assert list(handler.processing_files) == [str(tmp_path / n) for n in "bc"]
+
+
+def test_handler_organize_ready_skips_claimed_files(tmp_path: Path):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+
+    claimed = str(tmp_path / "a.txt")
+    handler.processing_files[claimed] = watcher.time.monotonic()
+    handler._organize_ready([(claimed, "created"), (str(tmp_path / "b.txt"), "moved")])
+
+    assert organizer.called == [tmp_path / "b.txt"]
+
+
+def test_handler_processing_keys_are_interned(tmp_path: Path):
     organizer = DummyOrganizer()
     handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
 
     file_path = tmp_path / "file.txt"
     file_path.write_text("hello", encoding="utf-8")
 
-    calls = {"count": 0}
+    handler._enqueue(file_path, "created")
+    key = next(iter(handler._pending))
+    assert key is sys.intern(canonical(file_path))
 
-    def fake_sleep(_t):
-        calls["count"] += 1
-        if calls["count"] == 2:
-            file_path.unlink()
+    handler._organize_ready([(key, "created")])
+    assert next(iter(handler.processing_files)) is key
 
-    monkeypatch.setattr(watcher.time, "sleep", fake_sleep)
 
-    handler._process_file(file_path, "created")
-    assert organizer.called == []
+def test_on_moved_drops_pending_source(tmp_path: Path):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+
+    src_path = tmp_path / "file.part"
+    dest_path = tmp_path / "file.txt"
+    src_path.write_text("hello", encoding="utf-8")
+    handler._enqueue(src_path, "created")
+    src_path.rename(dest_path)
+
+    handler.on_moved(DummyEvent(src_path=str(src_path), dest_path=str(dest_path)))
 
+    assert list(handler._pending) == [canonical(dest_path)]
+    due = handler._pop_due(watcher.time.monotonic() + watcher.SETTLE_DELAY)
+    assert [key for key, _size, _type in due] == [canonical(dest_path)]
 
-def test_handler_process_file_exception(tmp_path: Path, monkeypatch):
+
+def test_on_closed_skips_size_check(tmp_path: Path):
     organizer = DummyOrganizer()
     handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
 
     file_path = tmp_path / "file.txt"
     file_path.write_text("hello", encoding="utf-8")
+    handler._enqueue(file_path, "created")
+
+    handler.on_closed(DummyEvent(src_path=str(file_path)))
+    handler._enqueue(file_path, "created")
+
+    due = handler._pop_due(watcher.time.monotonic())
+    assert due == [(canonical(file_path), None, "closed")]
+    file_path.write_text("hello world", encoding="utf-8")
+    assert handler._check_file(due[0][0], None) == ("ready", None)
+
+
+def test_on_closed_ignores_directory(tmp_path: Path):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+
+    handler.on_closed(DummyEvent(src_path=str(tmp_path), is_directory=True))
+    assert handler._pending == {}
+
+
+def test_handler_organizes_settled_files_in_one_batch(tmp_path: Path):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+    file_paths = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    for file_path in file_paths:
+        file_path.write_text("hello", encoding="utf-8")
+        handler.on_closed(DummyEvent(src_path=str(file_path)))
 
-    monkeypatch.setattr(watcher.time, "sleep", lambda _t: None)
+    handler.start()
+    try:
+        deadline = watcher.time.monotonic() + 5
+        while not organizer.called and watcher.time.monotonic() < deadline:
+            watcher.time.sleep(0.01)
+    finally:
+        handler.stop()
 
-    original_stat = watcher.Path.stat
+    assert organizer.batches == [
+        [Path(canonical(file_path)) for file_path in file_paths]
+    ]
 
-    def fake_stat(self):
-        if self == file_path:
+
+def test_handler_organize_error_is_logged(tmp_path: Path, monkeypatch):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+
+    def boom(_paths):
+        raise RuntimeError("boom")
+
+    errors = []
+    monkeypatch.setattr(organizer, "organize_files", boom)
+    monkeypatch.setattr(handler.logger, "error", lambda *args: errors.append(args))
+
+    handler._organize_ready([(canonical(tmp_path / "file.txt"), "created")])
+    assert len(errors) == 1
+
+
+def test_handler_worker_waits_for_file_to_settle(tmp_path: Path, monkeypatch):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+    monkeypatch.setattr(watcher, "SETTLE_DELAY", 0.01)
+    monkeypatch.setattr(watcher, "RECHECK_DELAY", 0.01)
+
+    # Queued before it exists, so the first check sees a size change
+    file_path = tmp_path / "file.txt"
+    handler.start()
+    try:
+        handler._enqueue(file_path, "created")
+        file_path.write_text("hello", encoding="utf-8")
+        deadline = watcher.time.monotonic() + 5
+        while not organizer.called and watcher.time.monotonic() < deadline:
+            watcher.time.sleep(0.01)
+    finally:
+        handler.stop()
+
+    assert organizer.called == [Path(canonical(file_path))]
+
+
+def test_handler_check_file_exception(tmp_path: Path, monkeypatch):
+    organizer = DummyOrganizer()
+    handler = watcher.FileOrganizerHandler(cast(watcher.FileOrganizer, organizer))
+
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("hello", encoding="utf-8")
+
+    original_stat = watcher.os.stat
+
+    def fake_stat(path, *args, **kwargs):
+        if path == canonical(file_path):
             raise RuntimeError("boom")
-        return original_stat(self)
+        return original_stat(path, *args, **kwargs)
 
-    monkeypatch.setattr(watcher.Path, "stat", fake_stat)
+    monkeypatch.setattr(watcher.os, "stat", fake_stat)
 
-    handler._process_file(file_path, "created")
-    assert organizer.called == []
+    assert handler._check_file(canonical(file_path), 5) == ("dropped", None)
 
     other_path = tmp_path / "other.txt"
     other_path.write_text("ok", encoding="utf-8")
-    other_path.stat()
+    assert handler._check_file(canonical(other_path), 2) == ("ready", None)
 
 
 def test_watcher_start_no_dirs_exits(tmp_path: Path, monkeypatch):
@@ -252,6 +468,70 @@ def test_watcher_start_success(tmp_path: Path, monkeypatch):
     fw.stop()
     assert observer.stopped is True
     assert observer.joined is True
+    assert fw.handler._worker is None
+
+
+def test_watcher_start_shares_one_observer(tmp_path: Path, monkeypatch):
+    watch_dirs = [tmp_path / "a", tmp_path / "b"]
+    for watch_dir in watch_dirs:
+        watch_dir.mkdir()
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps(
+            {"watch_directories": [str(d) for d in watch_dirs + [tmp_path / "x"]]}
+        ),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(watcher, "Observer", DummyObserver)
+
+    fw = watcher.FileWatcher(str(config_path))
+    assert fw._valid_dirs == [str(d) for d in watch_dirs]
+    fw.start()
+
+    assert fw.observers == [fw.observer]
+    assert [path for _h, path, _r in fw.observer.scheduled] == [
+        str(d) for d in watch_dirs
+    ]
+    fw.stop()
+
+
+def test_watcher_start_falls_back_to_polling(tmp_path: Path, monkeypatch):
+    watch_dir = tmp_path / "watch"
+    watch_dir.mkdir()
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"watch_directories": [str(watch_dir)]}),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(watcher, "Observer", ExhaustedObserver)
+    monkeypatch.setattr(watcher, "PollingObserver", DummyPollingObserver)
+
+    fw = watcher.FileWatcher(str(config_path))
+    fw.start()
+
+    assert isinstance(fw.observer, DummyPollingObserver)
+    assert fw.observer.timeout == watcher.POLLING_INTERVAL
+    assert fw.observer.started is True
+    assert [path for _h, path, _r in fw.observer.scheduled] == [str(watch_dir)]
+    fw.stop()
+
+
+def test_watcher_start_reraises_other_os_errors(tmp_path: Path, monkeypatch):
+    watch_dir = tmp_path / "watch"
+    watch_dir.mkdir()
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"watch_directories": [str(watch_dir)]}),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(watcher, "Observer", lambda: ExhaustedObserver(errno.EACCES))
+
+    fw = watcher.FileWatcher(str(config_path))
+    with pytest.raises(OSError):
+        fw.start()
 
 
 def test_watcher_run_keyboard_interrupt(tmp_path: Path, monkeypatch):
@@ -264,12 +544,16 @@ def test_watcher_run_keyboard_interrupt(tmp_path: Path, monkeypatch):
     )
 
     monkeypatch.setattr(watcher, "Observer", DummyObserver)
-    monkeypatch.setattr(
-        watcher.time, "sleep", lambda _t: (_ for _ in ()).throw(KeyboardInterrupt())
-    )
 
     fw = watcher.FileWatcher(str(config_path))
+    monkeypatch.setattr(
+        fw._stop_event,
+        "wait",
+        lambda _t=None: (_ for _ in ()).throw(KeyboardInterrupt()),
+    )
     fw.run()
+    assert fw._stop_event.is_set()
+    assert fw.observer.stopped is True
 
 
 def test_watcher_run_unexpected_exception(tmp_path: Path, monkeypatch):
@@ -283,16 +567,76 @@ def test_watcher_run_unexpected_exception(tmp_path: Path, monkeypatch):
 
     monkeypatch.setattr(watcher, "Observer", DummyObserver)
 
-    def raise_error(_t):
+    def raise_error(_t=None):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(watcher.time, "sleep", raise_error)
-
     fw = watcher.FileWatcher(str(config_path))
+    monkeypatch.setattr(fw._stop_event, "wait", raise_error)
     with pytest.raises(SystemExit):
         fw.run()
 
 
+def test_watcher_run_stops_on_signal(tmp_path: Path, monkeypatch):
+    watch_dir = tmp_path / "watch"
+    watch_dir.mkdir()
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"watch_directories": [str(watch_dir)]}),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(watcher, "Observer", DummyObserver)
+    original = signal.getsignal(signal.SIGTERM)
+
+    fw = watcher.FileWatcher(str(config_path))
+
+    stop_event = fw._stop_event
+
+    def deliver_sigterm(_t=None):
+        # Land the signal while wait() holds the event's lock, calling the
+        # installed handler the way the interpreter would
+        with stop_event._cond:
+            signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+        return True
+
+    monkeypatch.setattr(stop_event, "wait", deliver_sigterm)
+    fw.run()
+
+    assert fw._received_signal == signal.SIGTERM
+    assert stop_event.is_set()
+    assert fw.observer.stopped is True
+    assert signal.getsignal(signal.SIGTERM) is original
+
+
+def test_watcher_repeated_signal_does_not_raise_again(tmp_path: Path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"watch_directories": []}), encoding="utf-8")
+    fw = watcher.FileWatcher(str(config_path))
+
+    with pytest.raises(watcher._StopSignal):
+        fw._handle_signal(signal.SIGINT, None)
+    fw._handle_signal(signal.SIGTERM, None)
+    assert fw._received_signal == signal.SIGTERM
+
+
+def test_watcher_run_returns_when_stopped(tmp_path: Path, monkeypatch):
+    watch_dir = tmp_path / "watch"
+    watch_dir.mkdir()
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"watch_directories": [str(watch_dir)]}),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(watcher, "Observer", DummyObserver)
+
+    fw = watcher.FileWatcher(str(config_path))
+    fw._stop_event.set()
+    fw.run()
+    assert fw.observer.started is True
+    fw.stop()
+
+
 def test_main_organize_first(tmp_path: Path, monkeypatch):
     watch_dir = tmp_path / "watch"
     watch_dir.mkdir()
@@ -302,30 +646,29 @@ def test_main_organize_first(tmp_path: Path, monkeypatch):
         encoding="utf-8",
     )
 
-    called = {"run": 0}
+    called = []
 
     class DummyOrganizer:
         def __init__(self, *_args, **_kwargs):
-            pass
+            called.append("organizer")
 
         def run(self):
-            called["run"] += 1
+            called.append("organize")
 
     class DummyWatcher:
         def __init__(self, *_args, **_kwargs):
-            pass
+            self.organizer = DummyOrganizer()
 
         def run(self):
-            called["run"] += 1
+            called.append("watch")
 
-    monkeypatch.setattr(watcher, "FileOrganizer", DummyOrganizer)
     monkeypatch.setattr(watcher, "FileWatcher", DummyWatcher)
     monkeypatch.setattr(
         sys, "argv", ["watcher.py", "--config", str(config_path), "--organize-first"]
     )
 
     watcher.main()
-    assert called["run"] == 2
+    assert called == ["organizer", "organize", "watch"]
 
 
 def test_main_default(tmp_path: Path, monkeypatch):
@@ -354,23 +697,15 @@ def test_main_default(tmp_path: Path, monkeypatch):
 
 
 def test_module_entrypoint(tmp_path: Path, monkeypatch):
-    watch_dir = tmp_path / "watch"
-    watch_dir.mkdir()
+    # No valid watch directory, so the re-executed module exits from start()
+    # before any observer or worker thread is created
     config_path = tmp_path / "config.json"
     config_path.write_text(
-        json.dumps({"watch_directories": [str(watch_dir)]}),
+        json.dumps({"watch_directories": [str(tmp_path / "missing")]}),
         encoding="utf-8",
     )
-
-    DummyWatcher = type(
-        "DummyWatcher",
-        (),
-        {"__init__": lambda self, *_a, **_k: None, "run": lambda self: None},
-    )
-
-    monkeypatch.setattr(watcher, "FileWatcher", DummyWatcher)
     monkeypatch.setattr(sys, "argv", ["watcher.py", "--config", str(config_path)])
 
-    import runpy
-
-    runpy.run_module("watcher", run_name="__main__")
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module("watcher", run_name="__main__")
+    assert exc_info.value.code == 1
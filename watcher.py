@@ -4,15 +4,46 @@ File Watcher - Real-time file system monitoring
 Monitors directories and automatically organizes new files
 """
 
+import argparse
+import errno
+import functools
+import heapq
 import os
+import signal
 import sys
 import time
 import logging
+import threading
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from watchdog.observers import Observer  # type: ignore
+from watchdog.observers.polling import PollingObserver  # type: ignore
 from watchdog.events import FileSystemEventHandler  # type: ignore
 from file_organizer import FileOrganizer
 
+# Seconds a processed path is ignored to swallow duplicate events
+PROCESSING_TTL = 5
+# Upper bound on remembered paths, so an event storm can't grow it unchecked
+PROCESSING_MAX = 1024
+# Seconds a new file must sit before its size is checked, and between
+# checks while it is still growing
+SETTLE_DELAY = 1.0
+RECHECK_DELAY = 0.5
+# Windows only delivers Ctrl+C between waits, so wake up there once a
+# second; elsewhere the main thread sleeps until stop() or a signal
+RUN_WAIT_TIMEOUT = 1.0 if os.name == "nt" else None
+# Seconds between directory scans when native watches are unavailable
+POLLING_INTERVAL = 2.0
+
+
+@functools.lru_cache(maxsize=1024)
+def _canonical_path(path: str) -> str:
+    """Resolve the parent folder's symlinks and intern the result as a key"""
+    # The file itself is left unresolved: a symlink dropped into a watched
+    # folder is organized as a link, never swapped for the file it targets
+    parent, name = os.path.split(path)
+    return sys.intern(os.path.join(os.path.realpath(parent), name))
+
 
 class FileOrganizerHandler(FileSystemEventHandler):
     """Handler for file system events"""
@@ -21,8 +52,33 @@ class FileOrganizerHandler(FileSystemEventHandler):
         super().__init__()
         self.organizer = organizer
         self.logger = logging.getLogger(__name__)
-        # Track recently modified files to avoid duplicate processing
-        self.processing_files = set()
+        # Track recently modified files to avoid duplicate processing,
+        # mapped to their monotonic timestamp (kept in timestamp order)
+        self.processing_files: Dict[str, float] = {}
+        self._processing_lock = threading.Lock()
+        # Files waiting to settle: path -> (deadline, last size, event type),
+        # where a size of None marks a file whose writer has closed it.
+        # The heap orders deadlines; stale heap entries are skipped on pop.
+        self._pending: Dict[str, Tuple[float, Optional[int], str]] = {}
+        self._deadlines: List[Tuple[float, str]] = []
+        self._pending_cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def start(self):
+        """Start the worker that organizes files once they settle"""
+        self._stopping = False
+        self._worker = threading.Thread(target=self._run_pending, daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        """Stop the worker thread"""
+        with self._pending_cond:
+            self._stopping = True
+            self._pending_cond.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
 
     def on_created(self, event):
         """Handle file creation events"""
@@ -30,63 +86,184 @@ class FileOrganizerHandler(FileSystemEventHandler):
             return
 
         file_path = Path(event.src_path)
-        self._process_file(file_path, "created")
+        self._enqueue(file_path, "created")
 
     def on_moved(self, event):
         """Handle file move events (e.g., downloads completing)"""
         if event.is_directory:
             return
 
+        # A rename within the folder must not organize the old name too
+        with self._pending_cond:
+            self._pending.pop(_canonical_path(event.src_path), None)
+
         # When a file is moved into the watched directory
         file_path = Path(event.dest_path)
-        self._process_file(file_path, "moved")
+        self._enqueue(file_path, "moved")
 
-    def _process_file(self, file_path: Path, event_type: str):
-        """Process a file with debouncing"""
-        # Skip if already processing
-        if str(file_path) in self.processing_files:
+    def on_closed(self, event):
+        """Handle a writer closing a file (inotify IN_CLOSE_WRITE)"""
+        if event.is_directory:
             return
 
-        try:
-            # Mark as processing
-            self.processing_files.add(str(file_path))
-
-            # Wait a bit to ensure file is fully written
-            # Especially important for large downloads
-            time.sleep(1)
-
-            # Check if file still exists and is accessible
-            if not file_path.exists():
+        # The write is known to be finished, so skip the size check
+        key = _canonical_path(event.src_path)
+        self._schedule(key, "closed", None, 0.0)
+
+    def _enqueue(self, file_path: Path, event_type: str):
+        """Schedule a file to be checked once it has had time to settle"""
+        key = _canonical_path(str(file_path))
+        with self._pending_cond:
+            entry = self._pending.get(key)
+            if entry is not None and entry[1] is None:
+                # Already closed by its writer; no need to wait any longer
                 return
-
-            # Check if file is still being written (size changes)
-            initial_size = file_path.stat().st_size
-            time.sleep(0.5)
-
-            if not file_path.exists():
-                return
-
-            current_size = file_path.stat().st_size
-            if initial_size != current_size:
-                self.logger.debug(f"File still being written: {file_path.name}")
+            if entry is not None:
+                # Coalesce: push the deadline back, keep the first size seen
+                deadline = time.monotonic() + SETTLE_DELAY
+                self._pending[key] = (deadline, entry[1], event_type)
                 return
 
-            # Organize the file
-            self.logger.info(f"New file {event_type}: {file_path.name}")
-            self.organizer.organize_file(file_path)
+        try:
+            size = os.stat(key).st_size
+        except OSError:
+            size = -1
+        self._schedule(key, event_type, size, SETTLE_DELAY)
+
+    def _schedule(self, key: str, event_type: str, size: Optional[int], delay: float):
+        """Set (or push back) the deadline of a pending file"""
+        deadline = time.monotonic() + delay
+        with self._pending_cond:
+            entry = self._pending.get(key)
+            self._pending[key] = (deadline, size, event_type)
+            # A later deadline is picked up when the old heap entry surfaces
+            if entry is None or deadline < entry[0]:
+                heapq.heappush(self._deadlines, (deadline, key))
+                self._pending_cond.notify()
+
+    def _next_timeout(self, now: float) -> Optional[float]:
+        """Seconds until the nearest live deadline, or None if idle"""
+        deadlines = self._deadlines
+        while deadlines:
+            deadline, key = deadlines[0]
+            entry = self._pending.get(key)
+            if entry is None:
+                heapq.heappop(deadlines)
+            elif entry[0] > deadline:
+                heapq.heapreplace(deadlines, (entry[0], key))
+            else:
+                return deadline - now
+        return None
+
+    def _pop_due(self, now: float) -> List[Tuple[str, Optional[int], str]]:
+        """Remove and return pending files whose deadline has passed"""
+        due = []
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            deadline, key = deadlines[0]
+            entry = self._pending.get(key)
+            if entry is None:
+                heapq.heappop(deadlines)
+            elif entry[0] > deadline:
+                # Deadline was extended by a later event
+                heapq.heapreplace(deadlines, (entry[0], key))
+            else:
+                heapq.heappop(deadlines)
+                del self._pending[key]
+                due.append((key, entry[1], entry[2]))
+        return due
+
+    def _run_pending(self):
+        """Worker loop: wait for the nearest deadline and process due files"""
+        cond = self._pending_cond
+        while True:
+            with cond:
+                while not self._stopping:
+                    timeout = self._next_timeout(time.monotonic())
+                    if timeout is not None and timeout <= 0:
+                        break
+                    cond.wait(timeout)
+                if self._stopping:
+                    return
+                due = self._pop_due(time.monotonic())
+
+            ready = []
+            for key, size, event_type in due:
+                state, new_size = self._check_file(key, size)
+                if state == "ready":
+                    ready.append((key, event_type))
+                elif state == "growing":
+                    with cond:
+                        # A newer event already rescheduled this file
+                        if key in self._pending:
+                            continue
+                    self._schedule(key, event_type, new_size, RECHECK_DELAY)
+
+            # Files that settled together are organized as one batch
+            if ready:
+                self._organize_ready(ready)
+
+    def _check_file(
+        self, key: str, last_size: Optional[int]
+    ) -> Tuple[str, Optional[int]]:
+        """Classify a due file as ("ready"|"growing"|"dropped", new size)"""
+        with self._processing_lock:
+            self._expire_processing(time.monotonic())
+            # Skip if already processing
+            if key in self.processing_files:
+                return ("dropped", None)
 
+        try:
+            # Check if file is still being written (size changes); a
+            # last_size of None means its writer already closed it
+            current_size = os.stat(key).st_size
+        except FileNotFoundError:
+            return ("dropped", None)
         except Exception as e:
-            self.logger.error(f"Error processing {file_path}: {str(e)}")
-        finally:
-            # Remove from processing set after a delay
-            # Use a thread timer to avoid blocking
-            import threading
+            self.logger.error("Error processing %s: %s", key, e)
+            return ("dropped", None)
+
+        if last_size is not None and current_size != last_size:
+            name = key[key.rfind(os.sep) + 1 :]
+            self.logger.debug("File still being written: %s", name)
+            return ("growing", current_size)
+        return ("ready", None)
+
+    def _organize_ready(self, ready: List[Tuple[str, str]]):
+        """Organize settled files with a single organizer call"""
+        now = time.monotonic()
+        files = self.processing_files
+        # Mark as processing. setdefault is an atomic test-and-set, so the
+        # mark doubles as the final duplicate check right before the move
+        ready = [item for item in ready if files.setdefault(item[0], now) is now]
+        if not ready:
+            return
+        with self._processing_lock:
+            # Oldest entries come first, so trimming keeps the newest ones
+            while len(files) > PROCESSING_MAX:
+                del files[next(iter(files))]
+
+        for key, event_type in ready:
+            self.logger.info(
+                "New file %s: %s", event_type, key[key.rfind(os.sep) + 1 :]
+            )
+        try:
+            self.organizer.organize_files([Path(key) for key, _event_type in ready])
+        except Exception as e:
+            self.logger.error("Error processing %d new files: %s", len(ready), e)
+
+    def _expire_processing(self, now: float):
+        """Drop processing entries older than PROCESSING_TTL"""
+        files = self.processing_files
+        while files:
+            oldest = next(iter(files))
+            if now - files[oldest] < PROCESSING_TTL:
+                break
+            del files[oldest]
 
-            def remove_from_processing():
-                time.sleep(5)
-                self.processing_files.discard(str(file_path))
 
-            threading.Thread(target=remove_from_processing, daemon=True).start()
+class _StopSignal(BaseException):
+    """Raised from the signal handler to unwind FileWatcher.run"""
 
 
 class FileWatcher:
@@ -95,7 +272,18 @@ class FileWatcher:
     def __init__(self, config_path: str = "config.json"):
         self.organizer = FileOrganizer(config_path)
         self.logger = logging.getLogger(__name__)
+        self.handler: Optional[FileOrganizerHandler] = None
+        self.observer = None
         self.observers = []
+        self._stop_event = threading.Event()
+        self._received_signal: Optional[int] = None
+        # Validate watch directories once so restarts skip the stat calls
+        self._valid_dirs: List[str] = []
+        for directory in self.organizer.config.get("watch_directories", []):
+            if Path(directory).is_dir():
+                self._valid_dirs.append(str(directory))
+            else:
+                self.logger.warning(f"Directory does not exist: {directory}")
 
     def start(self):
         """Start watching configured directories"""
@@ -105,27 +293,40 @@ class FileWatcher:
             self.logger.error("No directories configured to watch!")
             sys.exit(1)
 
+        if not self._valid_dirs:
+            self.logger.error("No valid directories to watch!")
+            sys.exit(1)
+
         # Create event handler
         event_handler = FileOrganizerHandler(self.organizer)
 
-        # Setup observers for each directory
-        for directory in watch_dirs:
-            dir_path = Path(directory)
-
-            if not dir_path.exists():
-                self.logger.warning(f"Directory does not exist: {directory}")
-                continue
-
-            observer = Observer()
-            observer.schedule(event_handler, str(dir_path), recursive=False)
-            observer.start()
-            self.observers.append(observer)
-
+        # One observer (and one native watch thread) serves every directory
+        observer = Observer()
+        for directory in self._valid_dirs:
+            observer.schedule(event_handler, directory, recursive=False)
             self.logger.info(f"Watching directory: {directory}")
 
-        if not self.observers:
-            self.logger.error("No valid directories to watch!")
-            sys.exit(1)
+        event_handler.start()
+        try:
+            observer.start()
+        except OSError as e:
+            # inotify watch (ENOSPC) or instance (EMFILE) limits exhausted
+            if e.errno not in (errno.ENOSPC, errno.EMFILE):
+                event_handler.stop()
+                raise
+            self.logger.warning(
+                f"Native file watching unavailable ({e}); polling every "
+                f"{POLLING_INTERVAL:g}s instead. Raise fs.inotify.max_user_watches "
+                "or fs.inotify.max_user_instances to avoid this."
+            )
+            observer.unschedule_all()
+            observer = PollingObserver(timeout=POLLING_INTERVAL)
+            for directory in self._valid_dirs:
+                observer.schedule(event_handler, directory, recursive=False)
+            observer.start()
+        self.handler = event_handler
+        self.observer = observer
+        self.observers = [observer]
 
         self.logger.info("=" * 60)
         self.logger.info("File Watcher is running...")
@@ -133,53 +334,82 @@ class FileWatcher:
         self.logger.info("=" * 60)
 
     def stop(self):
-        """Stop all observers"""
-        for observer in self.observers:
-            observer.stop()
-            observer.join()
+        """Stop the observer and the handler's worker"""
+        self._stop_event.set()
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+        if self.handler is not None:
+            self.handler.stop()
         self.logger.info("File Watcher stopped")
 
+    def _handle_signal(self, signum, _frame):
+        """Unwind run() on SIGINT/SIGTERM"""
+        # Take no locks here: the main thread may be inside Event.wait
+        # holding the event's (non-reentrant) lock, or inside logging
+        first = self._received_signal is None
+        self._received_signal = signum
+        # Raise only once so a repeated signal can't interrupt stop()
+        if first:
+            raise _StopSignal()
+
+    def _install_signal_handlers(self) -> Dict[int, object]:
+        """Route stop signals to _handle_signal, returning the old handlers"""
+        previous = {}
+        # Only the main thread may install handlers
+        if threading.current_thread() is not threading.main_thread():
+            return previous
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            previous[signum] = signal.signal(signum, self._handle_signal)
+        return previous
+
     def run(self):
         """Run the watcher"""
+        previous_handlers = self._install_signal_handlers()
         try:
             self.start()
 
-            # Keep the program running
-            while True:
-                time.sleep(1)
+            # Keep the program running until stop() or a signal
+            while not self._stop_event.wait(RUN_WAIT_TIMEOUT):
+                pass
 
-        except KeyboardInterrupt:
+        except (_StopSignal, KeyboardInterrupt):
+            # KeyboardInterrupt covers a Ctrl+C before the handlers are set
             self.logger.info("\nReceived interrupt signal...")
             self.stop()
         except Exception as e:
             self.logger.error(f"Unexpected error: {str(e)}")
             self.stop()
             sys.exit(1)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+
+# The CLI is static, so the parser is built once at import
+_PARSER = argparse.ArgumentParser(description="File Organizer Watcher")
+_PARSER.add_argument("--config", default="config.json", help="Path to config file")
+_PARSER.add_argument(
+    "--organize-first",
+    action="store_true",
+    help="Organize existing files before starting watcher",
+)
 
 
 def main():
     """Main entry point"""
-    import argparse
-
-    parser = argparse.ArgumentParser(description="File Organizer Watcher")
-    parser.add_argument("--config", default="config.json", help="Path to config file")
-    parser.add_argument(
-        "--organize-first",
-        action="store_true",
-        help="Organize existing files before starting watcher",
-    )
+    args = _PARSER.parse_args()
 
-    args = parser.parse_args()
+    watcher = FileWatcher(args.config)
 
-    # First, organize existing files if requested
+    # First, organize existing files if requested, reusing the watcher's
+    # organizer so config, rules and target folders are set up only once
     if args.organize_first:
         print("\nOrganizing existing files first...")
-        organizer = FileOrganizer(args.config)
-        organizer.run()
+        watcher.organizer.run()
         print("\nStarting file watcher...\n")
 
     # Start the watcher
-    watcher = FileWatcher(args.config)
     watcher.run()
 
 